@@ -192,11 +192,24 @@ class _DataBaseMetaClass(type):
         private_slots = attrs.setdefault("_private_slots", ())
 
         # Class slots are fields + private slots, this prevents other
-        # member attributes from being set and also improves performance
+        # member attributes from being set and also improves performance.
+        # Slots that are already provided by a base class are not redeclared
+        # since a duplicate slot shadows the base's slot and adds an unused
+        # entry to the layout of every instance.
+        base_slots = {
+            slot
+            for base in bases
+            for base_class in base.__mro__
+            for slot in base_class.__dict__.get("__slots__", ())
+        }
         attrs["__slots__"] = tuple(
-            [f"_{field}" for field in fields]
-            + list(private_slots)
-            + [mcs._BACKEND_ATTR, mcs._WHICH_ONEOF_ATTR]
+            slot
+            for slot in (
+                [f"_{field}" for field in fields]
+                + list(private_slots)
+                + [mcs._BACKEND_ATTR, mcs._WHICH_ONEOF_ATTR]
+            )
+            if slot not in base_slots
         )
 
         # Create the instance of the type
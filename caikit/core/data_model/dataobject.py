@@ -18,20 +18,8 @@ model objects inline without manually defining the protobufs representation
 
 
 # Standard
-from enum import Enum
-from typing import (
-    Any,
-    Callable,
-    Dict,
-    Iterable,
-    List,
-    Optional,
-    Type,
-    TypeVar,
-    Union,
-    get_args,
-    get_origin,
-)
+from enum import EnumMeta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Type, TypeVar, Union
 import dataclasses
 
 # Third Party
@@ -78,6 +66,13 @@ _AUTO_GEN_PROTO_CLASSES = []
 # Special attribute used to indicate which defaults are user provided
 _USER_DEFINED_DEFAULTS = "__user_defined_defaults__"
 
+# Instance attribute used to record which field of each oneof is set
+# noinspection PyProtectedMember
+_WHICH_ONEOF_ATTR = _DataBaseMetaClass._WHICH_ONEOF_ATTR
+
+# Special attribute used to hold the precomputed names of optional fields
+_OPTIONAL_FIELD_NAMES = "__optional_field_names__"
+
 ## Public ######################################################################
 
 
@@ -173,9 +168,11 @@ def dataobject(*args, **kwargs) -> Callable[[_DataObjectBaseT], _DataObjectBaseT
 
     def decorator(cls: _DataObjectBaseT) -> _DataObjectBaseT:
         # Make sure that the wrapped class does NOT inherit from DataBase
+        # NOTE: Checking the metaclass is equivalent to checking inheritance
+        #   here since every DataObjectBase/Enum subclass inherits it
         error.value_check(
             "<COR95184230E>",
-            issubclass(cls, (DataObjectBase, Enum)),
+            isinstance(cls, (_DataObjectBaseMetaClass, EnumMeta)),
             "{} must inherit from DataObjectBase/Enum when using @dataobject",
             cls.__name__,
         )
@@ -185,7 +182,7 @@ def dataobject(*args, **kwargs) -> Callable[[_DataObjectBaseT], _DataObjectBaseT
 
         # If it's not an enum, fill in any missing field defaults as None
         # and make sure it's a dataclass
-        if not issubclass(cls, Enum):
+        if not isinstance(cls, EnumMeta):
             # alog needs a stub file or some method of typing the monkey-patched methods.
             # Meanwhile, disable the type-checker for those calls.
             log.debug2("Wrapping data class %s", cls)  # type: ignore
@@ -204,6 +201,7 @@ def dataobject(*args, **kwargs) -> Callable[[_DataObjectBaseT], _DataObjectBaseT
                 delattr(cls, "__init__")
             cls = dataclasses.dataclass(repr=False)(cls)
             setattr(cls, _USER_DEFINED_DEFAULTS, user_defined_defaults)
+            setattr(cls, _OPTIONAL_FIELD_NAMES, _get_optional_field_names(cls))
 
         descriptor = _dataobject_to_proto(dataclass_=cls, **kwargs)
 
@@ -327,6 +325,11 @@ class _DataobjectConverter(DataclassConverter):
     def get_concrete_type(self, entry: Any) -> Any:
         """Also include data model classes and enums as concrete types"""
         unwrapped = self._resolve_wrapped_type(entry)
+        # Fast path for primitive types (including numpy scalars) that map
+        # directly to proto types. This is the same result the base class
+        # gives, but avoids the data model checks and unwrapping a second time.
+        if unwrapped in self.type_mapping:
+            return unwrapped
         if (
             isinstance(unwrapped, type)
             and issubclass(unwrapped, DataBase)
@@ -349,38 +352,55 @@ class _DataobjectConverter(DataclassConverter):
         """Get the names of any fields which are optional. This will be any
         field that has a user-defined default or is marked as Optional[]
         """
-        optional_fields = list(getattr(entry, _USER_DEFINED_DEFAULTS, {}))
-        for field_name, field in entry.__dataclass_fields__.items():
-            if (
-                field_name not in optional_fields
-                and self._is_python_optional(field.type) is not None
-            ):
-                optional_fields.append(field_name)
+        # NOTE: Dataobject classes have these precomputed by @dataobject, but
+        #   plain dataclasses (e.g. generated oneof sequence wrappers) do not
+        optional_fields = vars(entry).get(_OPTIONAL_FIELD_NAMES)
+        if optional_fields is None:
+            optional_fields = _get_optional_field_names(entry)
         return optional_fields
 
-    @staticmethod
-    def _is_python_optional(entry: Any) -> Any:
-        """Detect if this type is a python optional"""
-        if get_origin(entry) is Union:
-            args = get_args(entry)
-            return type(None) in args
+
+def _get_optional_field_names(cls: type) -> List[str]:
+    """Compute the names of the optional fields for a dataclass"""
+    user_defined_defaults = getattr(cls, _USER_DEFINED_DEFAULTS, {})
+    optional_fields = list(user_defined_defaults)
+    optional_fields.extend(
+        field_name
+        for field_name, field in cls.__dataclass_fields__.items()
+        if field_name not in user_defined_defaults and _is_python_optional(field.type)
+    )
+    return optional_fields
+
+
+def _is_python_optional(entry: Any) -> bool:
+    """Detect if this type is a python optional"""
+    return getattr(entry, "__origin__", None) is Union and type(None) in entry.__args__
 
 
 def _get_all_enums(
     proto_class: Union[_message.Message, EnumTypeWrapper],
 ) -> List[EnumTypeWrapper]:
-    """Given a generated proto class, recursively extract all enums"""
-    all_enums = []
+    """Given a generated proto class, extract all enums from it and all of its
+    nested messages
+    """
     if isinstance(proto_class, EnumTypeWrapper):
-        all_enums.append(proto_class)
-    else:
-        for enum_descriptor in proto_class.DESCRIPTOR.enum_types:
-            all_enums.append(getattr(proto_class, enum_descriptor.name))
-        for nested_proto_descriptor in proto_class.DESCRIPTOR.nested_types:
-            all_enums.extend(
-                _get_all_enums(getattr(proto_class, nested_proto_descriptor.name))
-            )
+        return [proto_class]
 
+    # Walk the nested messages depth-first with an explicit stack. Nested
+    # messages are pushed in reverse so that the enums are returned in the
+    # same order as a recursive pre-order traversal.
+    all_enums = []
+    stack = [proto_class]
+    while stack:
+        node = stack.pop()
+        desc = node.DESCRIPTOR
+        all_enums.extend(
+            getattr(node, enum_descriptor.name) for enum_descriptor in desc.enum_types
+        )
+        stack.extend(
+            getattr(node, nested_descriptor.name)
+            for nested_descriptor in reversed(desc.nested_types)
+        )
     return all_enums
 
 
@@ -388,29 +408,34 @@ def _make_data_model_class(proto_class: Type[_message.Message], cls):
     if issubclass(cls, DataObjectBase):
         _DataBaseMetaClass.parse_proto_descriptor(cls)
 
-    # Recursively make all nested message wrappers
-    for nested_message_descriptor in proto_class.DESCRIPTOR.nested_types:
-        nested_message_name = nested_message_descriptor.name
-        nested_proto_class = getattr(proto_class, nested_message_name)
-        setattr(
-            cls,
-            nested_message_name,
-            _make_data_model_class(
-                nested_proto_class,
-                _DataBaseMetaClass.__new__(
-                    _DataBaseMetaClass,
-                    name=nested_message_name,
-                    bases=(DataBase,),
-                    attrs={"_proto_class": getattr(proto_class, nested_message_name)},
-                ),
-            ),
-        )
-    for nested_enum_descriptor in proto_class.DESCRIPTOR.enum_types:
-        setattr(
-            cls,
-            nested_enum_descriptor.name,
-            getattr(enums, nested_enum_descriptor.name),
-        )
+    # Make all nested message wrappers, walking the nested messages with an
+    # explicit stack of (proto_class, data model class) pairs. The metaclass
+    # constructor and bases are bound once outside of the walk.
+    make_nested_class = _DataBaseMetaClass.__new__
+    nested_bases = (DataBase,)
+    stack = [(proto_class, cls)]
+    while stack:
+        node_proto_class, node_cls = stack.pop()
+        desc = node_proto_class.DESCRIPTOR
+        nested_classes = []
+        for nested_message_descriptor in desc.nested_types:
+            nested_message_name = nested_message_descriptor.name
+            nested_proto_class = getattr(node_proto_class, nested_message_name)
+            nested_cls = make_nested_class(
+                _DataBaseMetaClass,
+                name=nested_message_name,
+                bases=nested_bases,
+                attrs={"_proto_class": nested_proto_class},
+            )
+            setattr(node_cls, nested_message_name, nested_cls)
+            nested_classes.append((nested_proto_class, nested_cls))
+        for nested_enum_descriptor in desc.enum_types:
+            setattr(
+                node_cls,
+                nested_enum_descriptor.name,
+                getattr(enums, nested_enum_descriptor.name),
+            )
+        stack.extend(reversed(nested_classes))
 
     return cls
 
@@ -418,56 +443,87 @@ def _make_data_model_class(proto_class: Type[_message.Message], cls):
 def _make_oneof_init(cls):
     """Helper to augment a defaulted dataclass __init__ to support kwargs for
     oneof fields
+
+    The set of oneof fields is fixed for a given class, so the __init__ is
+    generated with the checks for each oneof field unrolled rather than
+    resolving every kwarg against the oneof maps at construction time.
     """
-    original_init = cls.__init__
-    fields_to_oneofs = cls._fields_to_oneof
+    field_positions = {
+        field_name: idx for idx, field_name in enumerate(cls.__dataclass_fields__)
+    }
     oneofs_to_fields = cls._fields_oneofs_map
+    namespace = {
+        "__name__": cls.__module__,
+        "original_init": cls.__init__,
+        "_WHICH_ONEOF_ATTR": _WHICH_ONEOF_ATTR,
+        "_conflicting_oneof_args": _conflicting_oneof_args,
+        "_multiple_oneof_kwargs": _multiple_oneof_kwargs,
+    }
+    lines = [
+        "def __init__(self, *args, **kwargs):",
+        "    init_kwargs = {",
+        "        key: val for key, val in kwargs.items() if key not in _oneof_fields",
+        "    }",
+        "    which_oneof = {}",
+    ]
+    namespace["_oneof_fields"] = frozenset(cls._fields_to_oneof)
+    for idx, (field_name, oneof_name) in enumerate(cls._fields_to_oneof.items()):
+        # The names that conflict with this field are bound into the namespace
+        other_fields = f"_other_fields_{idx}"
+        namespace[other_fields] = frozenset(
+            [oneof_name] + oneofs_to_fields[oneof_name]
+        ).difference([field_name])
+        lines.extend(
+            [
+                f"    if {field_name!r} in kwargs:",
+                f"        if len(args) > {field_positions[oneof_name]}:",
+                f"            _conflicting_oneof_args({oneof_name!r}, {field_name!r})",
+                f"        if not {other_fields}.isdisjoint(kwargs):",
+                f"            _multiple_oneof_kwargs({oneof_name!r})",
+                f"        init_kwargs[{oneof_name!r}] = kwargs[{field_name!r}]",
+                f"        which_oneof[{oneof_name!r}] = {field_name!r}",
+            ]
+        )
+    lines.extend(
+        [
+            "    original_init(self, *args, **init_kwargs)",
+            "    setattr(self, _WHICH_ONEOF_ATTR, which_oneof)",
+        ]
+    )
+    source = "\n".join(lines) + "\n"
+    log.debug4("Generated oneof __init__ for %s:\n%s", cls, source)  # type: ignore
+
+    # NOTE: The generated source only embeds repr()'d field names and integer
+    #   positions, so no caller-provided code is ever executed
+    exec(compile(source, f"<oneof_init {cls.__qualname__}>", "exec"), namespace)
+    init = namespace["__init__"]
+    init.__qualname__ = f"{cls.__qualname__}.__init__"
+    return init
+
+
+def _conflicting_oneof_args(oneof_name: str, field_name: str):
+    """Raise the error for a oneof given both positionally and by field kwarg"""
+    error(
+        "<COR09282193E>",
+        TypeError(
+            "Received conflicting oneof args/kwargs for {}/{}".format(
+                oneof_name,
+                field_name,
+            )
+        ),
+    )
 
-    def __init__(self, *args, **kwargs):
-        new_kwargs = {}
-        to_remove = []
-        which_oneof = {}
-        for field_name, val in kwargs.items():
-            if oneof_name := fields_to_oneofs.get(field_name):
-                oneof_pos_idx = list(cls.__dataclass_fields__.keys()).index(oneof_name)
-                has_pos_val = len(args) > oneof_pos_idx
-                if has_pos_val:
-                    error(
-                        "<COR09282193E>",
-                        TypeError(
-                            "Received conflicting oneof args/kwargs for {}/{}".format(
-                                oneof_name,
-                                field_name,
-                            )
-                        ),
-                    )
-
-                other_oneof_fields = (
-                    field
-                    for field in [oneof_name] + oneofs_to_fields[oneof_name]
-                    if field != field_name
-                )
-                if any(field in kwargs for field in other_oneof_fields):
-                    error(
-                        "<COR59933157E>",
-                        TypeError(
-                            "Received multiple keyword arguments for oneof {}".format(
-                                oneof_name,
-                            )
-                        ),
-                    )
-                new_kwargs[oneof_name] = val
-                to_remove.append(field_name)
-                which_oneof[oneof_name] = field_name
-
-        for kwarg in to_remove:
-            del kwargs[kwarg]
-        kwargs.update(new_kwargs)
-        original_init(self, *args, **kwargs)
-        # noinspection PyProtectedMember
-        setattr(self, _DataBaseMetaClass._WHICH_ONEOF_ATTR, which_oneof)
-
-    return __init__
+
+def _multiple_oneof_kwargs(oneof_name: str):
+    """Raise the error for a oneof given multiple field kwargs"""
+    error(
+        "<COR59933157E>",
+        TypeError(
+            "Received multiple keyword arguments for oneof {}".format(
+                oneof_name,
+            )
+        ),
+    )
 
 
 def _has_dataclass_init(cls) -> bool:
@@ -475,6 +531,7 @@ def _has_dataclass_init(cls) -> bool:
     __annotations__ to the init function itself. This function uses that fact to
     detect if the class's __init__ function was generated by @dataclass
     """
-    return bool(getattr(cls.__init__, "__annotations__", None)) and not any(
-        cls.__init__ is base.__init__ for base in cls.__bases__
-    )
+    # NOTE: An __init__ generated for this class will live in the class's own
+    #   __dict__ while an inherited one will not
+    init = vars(cls).get("__init__")
+    return init is not None and bool(getattr(init, "__annotations__", None))
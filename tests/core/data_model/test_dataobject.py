@@ -1395,3 +1395,91 @@ def test_dataobject_from_json_ignore_unknown_fields():
     m1 = Moo.from_json({"foo": 2, "boo": True}, ignore_unknown_fields=True)
     assert isinstance(m1, Moo)
     assert m1.foo == 2
+
+
+def test_dataobject_optional_field_names_precomputed():
+    """Make sure that the optional field names are computed once when the
+    class is decorated
+    """
+
+    @dataobject
+    class Foo(DataObjectBase):
+        foo: int
+        bar: Optional[str]
+        baz: Union[int, str]
+        bat: int = 1
+
+    assert Foo.__optional_field_names__ == ["bat", "bar"]
+    assert Foo.get_proto_class().DESCRIPTOR.fields_by_name["bar"].has_presence
+    assert not Foo.get_proto_class().DESCRIPTOR.fields_by_name["foo"].has_presence
+
+
+def test_dataobject_slots_not_redeclared():
+    """Make sure that slots provided by base classes are not redeclared by
+    derived dataobject classes
+    """
+
+    @dataobject
+    class Base(DataObjectBase):
+        foo: int
+
+    @dataobject
+    class Derived(Base):
+        bar: str
+
+    assert DataObjectBase.__slots__ == ()
+    assert Base.__slots__ == ("_foo",)
+    assert Derived.__slots__ == ("_bar",)
+    inst = Derived(foo=1, bar="two")
+    assert not hasattr(inst, "__dict__")
+    assert inst.foo == 1
+    assert inst.bar == "two"
+
+
+def test_dataobject_generated_nested_messages():
+    """Make sure that nested messages and enums generated from the dataclass
+    types are bound to the data model class
+    """
+
+    class Color(Enum):
+        RED = 1
+        BLUE = 2
+
+    @dataobject
+    class Foo(DataObjectBase):
+        colors: Dict[str, Color]
+        bar: Union[List[int], List[str]]
+
+    assert issubclass(Foo.ColorsEntry, DataBase)
+    assert issubclass(Foo.BarIntSequence, DataBase)
+    assert issubclass(Foo.BarStrSequence, DataBase)
+    assert Foo.ColorsColor is enums.ColorsColor
+    inst = Foo(colors={"a": 1}, bar_int_sequence=Foo.BarIntSequence([1, 2]))
+    round_trip = Foo.from_proto(inst.to_proto())
+    assert round_trip.which_oneof("bar") == "bar_int_sequence"
+    assert round_trip.colors == {"a": 1}
+
+
+def test_dataobject_oneof_init_metadata():
+    """Make sure that the generated oneof __init__ looks like it belongs to
+    the class and still rejects conflicting oneof arguments
+    """
+
+    @dataobject
+    class Foo(DataObjectBase):
+        foo: int
+        bar: Union[int, str]
+
+    assert Foo.__init__.__qualname__ == f"{Foo.__qualname__}.__init__"
+    assert Foo.__init__.__module__ == Foo.__module__
+    inst = Foo(foo=1, bar_int=2)
+    assert inst.bar == 2
+    assert inst.which_oneof("bar") == "bar_int"
+
+    # A positional value and a sub-field kwarg for the same oneof conflict
+    with pytest.raises(TypeError):
+        Foo(1, 2, bar_int=3)
+
+    # The oneof name and one of its sub-fields can't both be given
+    with pytest.raises(TypeError):
+        Foo(foo=1, bar=2, bar_int=3)